@@ -0,0 +1,254 @@
+import math
+import random
+from array import array
+import numpy as np
+from xxhash import xxh3_64_intdigest
+
+class BloomFilter:
+    """
+    Cache-line blocked Bloom filter, hashed with xxHash3.
+    The bit array is split into 64-byte (512-bit) blocks. One xxh3 digest of a
+    key picks a block with its low 32 bits, and with its high bits picks one of
+    a fixed table of random k-bit patterns and a rotation of it within the
+    block. All k bits of a key therefore share one cache line, and a membership
+    test is a single AND of the block against a precomputed mask instead of k
+    scattered memory accesses.
+    Keys are spread unevenly over blocks, so crowded blocks raise the false
+    positive rate above that of an unblocked filter with the same bits. The
+    filter is sized with a blocked model instead, which takes roughly 5-20%
+    more bits than an unblocked filter for the same error rate (more for
+    lower rates).
+    """
+    __slots__ = ('capacity', 'error_rate', 'num_hashes', 'num_blocks', 'num_bits', 'bits', 'count',
+                 'pattern_masks', 'pattern_positions', 'full_mask')
+    BLOCK_BYTES = 64
+    BLOCK_BITS = BLOCK_BYTES * 8
+    NUM_PATTERNS = 4096
+    # Pattern positions and masks per number of hashes, shared by every filter
+    pattern_tables = {}
+
+    def __init__(self, capacity, error_rate=0.001):
+        """
+        Input: capacity (int) - Maximum number of elements, error_rate (float) - False positive rate
+        Output: None
+        Sizes the bit array and number of hash functions for the target false positive rate.
+        """
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_hashes = math.ceil(math.log2(1 / error_rate))
+        # Start from the unblocked size and grow until the blocked model meets the target rate
+        num_bits = math.ceil(capacity * abs(math.log(error_rate)) / math.log(2) ** 2)
+        self.num_blocks = -(-num_bits // self.BLOCK_BITS)
+        while self.blocked_error_rate(capacity / self.num_blocks, self.num_hashes) > error_rate:
+            self.num_blocks += max(1, self.num_blocks // 50)
+        self.num_bits = self.num_blocks * self.BLOCK_BITS
+        self.bits = bytearray(self.num_blocks * self.BLOCK_BYTES)
+        self.count = 0
+        # Fixed table of k distinct random positions per pattern; a key's mask is one pattern rotated by its start position
+        if self.num_hashes not in self.pattern_tables:
+            pattern_rng = random.Random(self.num_hashes)
+            positions = [pattern_rng.sample(range(self.BLOCK_BITS), self.num_hashes) for _ in range(self.NUM_PATTERNS)]
+            masks = [sum(1 << position for position in pattern) for pattern in positions]
+            self.pattern_tables[self.num_hashes] = (np.array(positions, dtype=np.int64), masks)
+        self.pattern_positions, self.pattern_masks = self.pattern_tables[self.num_hashes]
+        self.full_mask = (1 << self.BLOCK_BITS) - 1
+
+    @classmethod
+    def blocked_error_rate(cls, keys_per_block, num_hashes):
+        """
+        Input: keys_per_block (float) - Average number of keys per block, num_hashes (int) - Bits set per key
+        Output: float - Expected false positive rate of a blocked filter at that load
+        Averages the false positive rate of a block holding c keys over the
+        Poisson distribution of c, as keys land in blocks at random.
+        """
+        fill = num_hashes / cls.BLOCK_BITS
+        probability = math.exp(-keys_per_block)
+        rate = 0.0
+        for keys in range(int(keys_per_block + 12 * math.sqrt(keys_per_block) + 20)):
+            rate += probability * (1 - (1 - fill) ** keys) ** num_hashes
+            probability *= keys_per_block / (keys + 1)
+        return rate
+
+    def _locate(self, key):
+        """
+        Input: key (bytes) - The key to hash
+        Output: tuple[int, int] - Byte offset of the key's block and the key's bit mask within it
+        Derives the block, pattern and rotation from one xxh3 digest.
+        """
+        h = xxh3_64_intdigest(key)
+        block_bits = self.BLOCK_BITS
+        start = (h >> 32) % block_bits
+        mask = self.pattern_masks[(h >> 41) % self.NUM_PATTERNS]
+        mask = ((mask << start) | (mask >> (block_bits - start))) & self.full_mask
+        return (h & 0xFFFFFFFF) % self.num_blocks * self.BLOCK_BYTES, mask
+
+    def add(self, key):
+        """
+        Input: key (bytes) - The key to add
+        Output: bool - True if every bit was already set (key possibly present), False otherwise
+        Sets the k bits for the key in its block.
+        """
+        offset, mask = self._locate(key)
+        end = offset + self.BLOCK_BYTES
+        block = int.from_bytes(self.bits[offset:end], 'little')
+        if block & mask == mask:
+            return True
+        self.bits[offset:end] = (block | mask).to_bytes(self.BLOCK_BYTES, 'little')
+        self.count += 1
+        return False
+
+    def __contains__(self, key):
+        """
+        Input: key (bytes) - The key to check
+        Output: bool - True if the key may be present, False if it is definitely absent
+        Tests the k bits for the key against its block in one operation.
+        """
+        offset, mask = self._locate(key)
+        return int.from_bytes(self.bits[offset:offset + self.BLOCK_BYTES], 'little') & mask == mask
+
+    def contains_batch(self, keys):
+        """
+        Input: keys (list[bytes]) - The keys to check
+        Output: np.ndarray[bool] - Whether each key may be present, in the order given
+        Hashes every key in one pass, then gathers all keys' k bits with numpy
+        array operations rather than a Python call per key. Matches
+        __contains__ bit for bit.
+        """
+        hashes = np.fromiter(map(xxh3_64_intdigest, keys), dtype=np.uint64, count=len(keys))
+        block_bits = self.BLOCK_BITS
+        offsets = ((hashes & 0xFFFFFFFF) % self.num_blocks * self.BLOCK_BYTES).astype(np.int64)
+        starts = ((hashes >> 32) % block_bits).astype(np.int64)
+        patterns = ((hashes >> 41) % self.NUM_PATTERNS).astype(np.int64)
+        # One row of k rotated in-block positions per key
+        positions = (self.pattern_positions[patterns] + starts[:, None]) % block_bits
+        bits = np.frombuffer(self.bits, dtype=np.uint8)
+        # Bit p of a block is bit p % 8 of its byte p // 8, as in the little-endian masks
+        probes = bits[offsets[:, None] + (positions >> 3)] >> (positions & 7)
+        return (probes & 1).all(axis=1)
+
+    def __len__(self):
+        """
+        Input: None
+        Output: int - Number of keys added to the filter
+        """
+        return self.count
+
+class CuckooFilter:
+    """
+    Cuckoo filter with 16- or 32-bit fingerprints, hashed with xxHash3.
+    One xxh3 digest of a key supplies both its fingerprint and its primary
+    bucket; the alternate bucket is the primary XOR a hash of the fingerprint,
+    so a fingerprint can always be moved between its two buckets.
+    Fingerprints are stored in a flat array, with 0 marking an empty slot. A
+    lookup compares against at most 2 * bucket_size fingerprints of f bits, so
+    the false positive rate is at most 2 * bucket_size / 2^f: about 0.00012 for
+    the default 16-bit slots with 4-slot buckets, within error_rate by construction.
+    """
+    __slots__ = ('bucket_size', 'max_kicks', 'num_buckets', 'fingerprint_bits', 'table', 'count')
+
+    def __init__(self, capacity, error_rate=0.001, bucket_size=4, max_kicks=500):
+        """
+        Input: capacity (int) - Maximum number of elements, error_rate (float) - Target false positive rate,
+               bucket_size (int) - Slots per bucket, max_kicks (int) - Evictions to attempt before declaring the filter full
+        Output: None
+        Allocates a power-of-two number of buckets large enough for the capacity,
+        with slots wide enough for fingerprints of at least log2(2 * bucket_size / error_rate) bits.
+        """
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        needed_bits = math.ceil(math.log2(2 * bucket_size / error_rate))
+        if needed_bits > 32:
+            raise ValueError("error_rate needs fingerprints wider than 32 bits")
+        # Fingerprints fill their whole slot, so the rate only improves on the target
+        self.fingerprint_bits = 16 if needed_bits <= 16 else 32
+        self.bucket_size = bucket_size
+        self.max_kicks = max_kicks
+        self.num_buckets = 1 << max(0, math.ceil(math.log2(capacity / bucket_size)))
+        typecode = 'H' if self.fingerprint_bits == 16 else 'L'
+        self.table = array(typecode, bytes(self.num_buckets * bucket_size * array(typecode).itemsize))
+        self.count = 0
+
+    def _locate(self, key):
+        """
+        Input: key (bytes) - The key to hash
+        Output: tuple[int, int, int] - The key's fingerprint and its two candidate buckets
+        """
+        h = xxh3_64_intdigest(key)
+        bits = self.fingerprint_bits
+        fingerprint = (h & ((1 << bits) - 1)) or 1
+        index_1 = (h >> bits) & (self.num_buckets - 1)
+        return fingerprint, index_1, self._alternate(index_1, fingerprint)
+
+    def _alternate(self, index, fingerprint):
+        """
+        Input: index (int) - A bucket index, fingerprint (int) - The fingerprint stored there
+        Output: int - The other bucket the fingerprint may live in
+        """
+        return (index ^ (fingerprint * 0x5BD1E995)) & (self.num_buckets - 1)
+
+    def _bucket_insert(self, index, fingerprint):
+        """
+        Input: index (int) - Bucket index, fingerprint (int) - Fingerprint to store
+        Output: bool - True if the bucket had a free slot, False otherwise
+        """
+        start = index * self.bucket_size
+        bucket = self.table[start:start + self.bucket_size]
+        if 0 not in bucket:
+            return False
+        self.table[start + bucket.index(0)] = fingerprint
+        return True
+
+    def insert(self, key):
+        """
+        Input: key (bytes) - The key to insert
+        Output: None
+        Stores the key's fingerprint, evicting existing fingerprints to their
+        alternate buckets when both candidate buckets are full. If no free slot
+        is found within max_kicks evictions, the evictions are undone, so every
+        previously inserted key is still found, and RuntimeError is raised.
+        """
+        fingerprint, index_1, index_2 = self._locate(key)
+        if self._bucket_insert(index_1, fingerprint) or self._bucket_insert(index_2, fingerprint):
+            self.count += 1
+            return
+        table = self.table
+        bucket_size = self.bucket_size
+        index = random.choice((index_1, index_2))
+        evicted_slots = []
+        for _ in range(self.max_kicks):
+            slot = index * bucket_size + random.randrange(bucket_size)
+            evicted_slots.append(slot)
+            fingerprint, table[slot] = table[slot], fingerprint
+            index = self._alternate(index, fingerprint)
+            if self._bucket_insert(index, fingerprint):
+                self.count += 1
+                return
+        # Replay the swaps in reverse to put every evicted fingerprint back where it was
+        for slot in reversed(evicted_slots):
+            fingerprint, table[slot] = table[slot], fingerprint
+        raise RuntimeError("Cuckoo filter is full")
+
+    def __contains__(self, key):
+        """
+        Input: key (bytes) - The key to check
+        Output: bool - True if the key may be present, False if it is definitely absent
+        Looks for the key's fingerprint in both of its candidate buckets.
+        """
+        fingerprint, index_1, index_2 = self._locate(key)
+        table = self.table
+        size = self.bucket_size
+        return (fingerprint in table[index_1 * size:(index_1 + 1) * size]
+                or fingerprint in table[index_2 * size:(index_2 + 1) * size])
+
+    def __len__(self):
+        """
+        Input: None
+        Output: int - Number of keys inserted into the filter
+        """
+        return self.count
@@ -1,44 +1,96 @@
-import random
 import string
+import numpy as np
 from faker import Faker
 from tqdm import tqdm
 
 # Initialize Faker for generating realistic names/usernames
 fake = Faker()
 
+# Initialize numpy generator for drawing random values in large blocks
+rng = np.random.default_rng()
+
 DATA_PATH = "./data/logins.txt"
+BLOCK_SIZE = 100000  # Number of logins assembled per vectorized block
+POOL_SIZE = 100000  # Number of Faker samples drawn for each name pool
+WRITE_CHUNK_SIZE = 100000  # Number of logins joined into each file write
+WRITE_BUFFER_SIZE = 1 << 20  # Output file buffer size in bytes
+STRATEGIES = ['username', 'firstname_numbers', 'lastname_numbers',
+              'firstname_lastname', 'email_prefix', 'random_letters']
+LETTER_STR = string.ascii_lowercase
+
+# Precomputed digit strings of each width, so a suffix is one table lookup instead of a join
+DIGITS1 = np.array([f"{i:01d}".encode() for i in range(10)])
+DIGITS2 = np.array([f"{i:02d}".encode() for i in range(100)])
+DIGITS3 = np.array([f"{i:03d}".encode() for i in range(1000)])
+DIGITS4 = np.array([f"{i:04d}".encode() for i in range(10000)])
+DIGIT_TABLES = (DIGITS1, DIGITS2, DIGITS3, DIGITS4)
 
-def generate_login():
+# All tables laid end to end, so suffixes of mixed widths can be gathered in one indexing call
+DIGIT_SUFFIXES = np.concatenate(DIGIT_TABLES)
+DIGIT_MODULI = np.array([len(table) for table in DIGIT_TABLES], dtype=np.uint64)
+DIGIT_OFFSETS = np.cumsum(DIGIT_MODULI) - DIGIT_MODULI
+
+def build_name_pools():
     """
     Input: None
-    Output: str - A randomly generated login name
-    Generates a login using one of six different strategies for variety.
+    Output: dict[str, np.ndarray] - Byte string pools of usernames, first names, last names and email prefixes
+    Samples each Faker provider POOL_SIZE times up front, so generating a login
+    only indexes into a pool instead of walking Faker's provider stack.
     """
-    # Randomly select a generation strategy
-    strategy = random.choice(['username', 'firstname_numbers', 'lastname_numbers',
-                             'firstname_lastname', 'email_prefix', 'random_letters'])
-
-    if strategy == 'username':
-        login = fake.user_name()
-    elif strategy == 'firstname_numbers':
-        # Firstname with 1-4 random digits
-        login = fake.first_name().lower() + ''.join(random.choices(string.digits, k=random.randint(1, 4)))
-    elif strategy == 'lastname_numbers':
-        # Lastname with 1-4 random digits
-        login = fake.last_name().lower() + ''.join(random.choices(string.digits, k=random.randint(1, 4)))
-    elif strategy == 'firstname_lastname':
-        # Combined first and last name
-        login = fake.first_name().lower() + fake.last_name().lower()
-    elif strategy == 'email_prefix':
-        # Username portion of email address
-        login = fake.email().split('@')[0]
-    else:
-        # Random letters with 2 digits at end
-        length = random.randint(5, 12)
-        login = ''.join(random.choices(string.ascii_lowercase, k=length-2))
-        login += ''.join(random.choices(string.digits, k=2))
-
-    return login
+    return {
+        'username': np.array([fake.user_name().encode() for _ in range(POOL_SIZE)]),
+        'first': np.array([fake.first_name().lower().encode() for _ in range(POOL_SIZE)]),
+        'last': np.array([fake.last_name().lower().encode() for _ in range(POOL_SIZE)]),
+        'email_prefix': np.array([fake.email().split('@')[0].encode() for _ in range(POOL_SIZE)]),
+    }
+
+def generate_login_block(pools, size=BLOCK_SIZE):
+    """
+    Input: pools (dict) - Name pools from build_name_pools, size (int) - Number of logins to generate
+    Output: list[bytes] - Randomly generated login names, possibly with duplicates
+    Generates a block of logins, each using one of six different strategies for variety.
+    Every random choice is peeled off one 64-bit word per login, and both the
+    decoding and the string assembly run as whole-array numpy operations
+    rather than a Python loop over the block.
+    """
+    # Draw one random word per login and select each login's strategy from its low bits
+    words = rng.integers(np.iinfo(np.uint64).max, size=size, dtype=np.uint64, endpoint=True)
+    words, strategy = np.divmod(words, len(STRATEGIES))
+    selected = {name: strategy == i for i, name in enumerate(STRATEGIES)}
+
+    # Decode up to two pool indices and a 1-4 digit suffix for the name-based strategies
+    name_words, name_index = np.divmod(words, POOL_SIZE)
+    name_words, other_index = np.divmod(name_words, POOL_SIZE)
+    digit_words, digit_count = np.divmod(name_words, len(DIGIT_TABLES))
+    suffixes = DIGIT_SUFFIXES[DIGIT_OFFSETS[digit_count] + digit_words % DIGIT_MODULI[digit_count]]
+    parts = []
+
+    # Faker username
+    parts.append(pools['username'][name_index[selected['username']]])
+
+    # Firstname or lastname with 1-4 random digits
+    mask = selected['firstname_numbers']
+    parts.append(np.char.add(pools['first'][name_index[mask]], suffixes[mask]))
+    mask = selected['lastname_numbers']
+    parts.append(np.char.add(pools['last'][name_index[mask]], suffixes[mask]))
+
+    # Combined first and last name
+    mask = selected['firstname_lastname']
+    parts.append(np.char.add(pools['first'][name_index[mask]], pools['last'][other_index[mask]]))
+
+    # Username portion of email address
+    parts.append(pools['email_prefix'][name_index[selected['email_prefix']]])
+
+    # Random letters with 2 digits at end, 5-12 characters in total
+    letter_words, length = np.divmod(words[selected['random_letters']], 8)
+    letter_words, digit_value = np.divmod(letter_words, len(DIGITS2))
+    letters = np.zeros((len(letter_words), 10), dtype=np.uint8)
+    for j in range(letters.shape[1]):
+        letter_words, letter = np.divmod(letter_words, len(LETTER_STR))
+        letters[:, j] = np.where(j < length + 3, letter + ord('a'), 0)
+    parts.append(np.char.add(letters.view('S10').ravel(), DIGITS2[digit_value]))
+
+    return np.concatenate(parts).tolist()
 
 def generate_unique_logins(count, output_file=DATA_PATH):
     """
@@ -46,19 +98,29 @@ def generate_unique_logins(count, output_file=DATA_PATH):
     Output: None
     Generates unique login names and writes them sorted to a file.
     """
+    pools = build_name_pools()
     logins = set()
     attempts = count * 2  # Try up to 2x the count to ensure uniqueness
 
-    # Generate unique logins using a set to avoid duplicates
-    for _ in tqdm(range(attempts), desc='Generating logins'):
-        logins.add(generate_login())
-        if len(logins) >= count:
-            break
+    # Generate unique logins using a set to avoid duplicates, one block at a time
+    with tqdm(total=count, desc='Generating logins', mininterval=1.0) as pbar:
+        while attempts > 0 and len(logins) < count:
+            # Never draw more than the logins still missing, so the count is not overshot
+            found = len(logins)
+            block = generate_login_block(pools, min(BLOCK_SIZE, attempts, count - found))
+            logins.update(block)
+            attempts -= len(block)
+            pbar.update(len(logins) - found)
+
+    # Sort as a fixed-width numpy array so ordering runs in C rather than on Python strings
+    width = max(map(len, logins), default=1)
+    sorted_logins = np.sort(np.fromiter(logins, dtype=f'S{width}', count=len(logins)))
 
-    # Write sorted logins to file
-    with open(output_file, 'w') as f:
-        for login in tqdm(sorted(logins), desc='Writing to file'):
-            f.write(login + '\n')
+    # Write sorted logins to file in large chunks rather than one small write per login
+    with open(output_file, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        for start in tqdm(range(0, len(sorted_logins), WRITE_CHUNK_SIZE), desc='Writing to file', mininterval=1.0):
+            chunk = sorted_logins[start:start + WRITE_CHUNK_SIZE].tolist()
+            f.write(b'\n'.join(chunk) + b'\n')
 
     print(f'Generated {len(logins)} unique logins to {output_file}')
 